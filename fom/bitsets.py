@@ -0,0 +1,289 @@
+"""
+Describes subsets of a finite set of elements as bitmasks. Each element is
+assigned a position once, after which a subset is an arbitrary-precision
+``int`` whose set bits are the positions of the elements in the subset.
+Complements, intersections, unions and subset tests then become single
+integer operations.
+"""
+from typing import AbstractSet, Collection, Container, Dict, Generic
+from typing import Iterable, Iterator, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+def popcount(mask: int) -> int:
+    """
+
+    :param mask: The bitmask for which set bits are to be counted
+    :return: The number of set bits in the mask
+    """
+    return bin(mask).count('1')
+
+
+class ElementIndex(Collection[T], Generic[T]):
+    """
+    Assigns each element of a finite collection a position in a bitmask. The
+    index is itself a collection of the elements, iterating in the order of
+    their positions.
+    """
+    def __init__(self, elements: Iterable[T]) -> None:
+        """
+
+        :param elements: The elements to index. Repeated elements are
+            given the position of their first occurrence
+        """
+        positions = {}  # type: Dict[T, int]
+        for element in elements:
+            if element not in positions:
+                positions[element] = len(positions)
+
+        self._positions = positions
+        self._elements = tuple(positions)  # type: Tuple[T, ...]
+        self._full_mask = (1 << len(self._elements)) - 1
+
+    @property
+    def full_mask(self) -> int:
+        """
+
+        :return: The mask with the bit of every element set
+        """
+        return self._full_mask
+
+    def position(self, element: T) -> int:
+        """
+
+        :param element: The element whose position is to be found
+        :return: The position of the element in the index
+        :raises KeyError: If the element is not in the index
+        """
+        return self._positions[element]
+
+    def element(self, position: int) -> T:
+        """
+
+        :param position: The position to look up
+        :return: The element at that position
+        """
+        return self._elements[position]
+
+    def to_mask(self, container: Container[T]) -> int:
+        """
+        Convert a container into a mask. Items of the container that are not
+        in the index are ignored, in keeping with the definition of
+        containment in :class:`fom.interfaces.Topology`.
+
+        :param container: The container to convert
+        :return: The mask of indexed elements that are in the container
+        """
+        if isinstance(container, Bitset) and container.index is self:
+            return container.mask
+
+        mask = 0
+        if isinstance(container, Collection):
+            for item in container:
+                position = self._get_position(item)
+                if position is not None:
+                    mask |= 1 << position
+        else:
+            for position, element in enumerate(self._elements):
+                if element in container:
+                    mask |= 1 << position
+        return mask
+
+    def try_mask(self, collection: object) -> Optional[int]:
+        """
+        Strict variant of :meth:`to_mask` used for membership tests.
+
+        :param collection: The object to convert
+        :return: The mask of the collection, or ``None`` if the object is not
+            iterable or contains an item that is not in the index
+        """
+        if isinstance(collection, Bitset) and collection.index is self:
+            return collection.mask
+        if not isinstance(collection, Iterable):
+            return None
+
+        mask = 0
+        for item in collection:
+            position = self._get_position(item)
+            if position is None:
+                return None
+            mask |= 1 << position
+        return mask
+
+    def members(self, mask: int) -> Iterator[T]:
+        """
+
+        :param mask: The mask to decode
+        :return: An iterator over the elements whose bits are set, in the
+            order of their positions
+        """
+        elements = self._elements
+        for position, bit in enumerate(reversed(bin(mask)[2:])):
+            if bit == '1':
+                yield elements[position]
+
+    def positions(self, mask: int) -> Iterator[int]:
+        """
+
+        :param mask: The mask to decode
+        :return: An iterator over the positions of the set bits in the mask
+        """
+        for position, bit in enumerate(reversed(bin(mask)[2:])):
+            if bit == '1':
+                yield position
+
+    def _get_position(self, item: object) -> Optional[int]:
+        """
+
+        :param item: The item to look up
+        :return: The position of the item, or ``None`` if it is not indexed
+        """
+        try:
+            return self._positions.get(item)
+        except TypeError:
+            return None
+
+    def __contains__(self, item: object) -> bool:
+        return self._get_position(item) is not None
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._elements)
+
+    def __len__(self) -> int:
+        return len(self._elements)
+
+    def __repr__(self) -> str:
+        return '{0}(elements={1})'.format(
+            self.__class__.__name__, self._elements
+        )
+
+
+class Bitset(AbstractSet[T], Generic[T]):
+    """
+    An immutable set of elements stored as a mask over an
+    :class:`ElementIndex`. Membership and length are constant time, and the
+    set compares and hashes equal to a ``frozenset`` with the same elements.
+    """
+    def __init__(self, index: ElementIndex[T], mask: int) -> None:
+        """
+
+        :param index: The index assigning elements to bit positions
+        :param mask: The mask of elements in this set
+        """
+        self._index = index
+        self._mask = mask
+        self._length = None  # type: Optional[int]
+        self._hash = None  # type: Optional[int]
+
+    @property
+    def index(self) -> ElementIndex[T]:
+        """
+
+        :return: The index over which this set is defined
+        """
+        return self._index
+
+    @property
+    def mask(self) -> int:
+        """
+
+        :return: The bitmask of this set
+        """
+        return self._mask
+
+    def difference(self, other: Container[T]) -> 'Bitset[T]':
+        """
+
+        :param other: The elements to remove
+        :return: The elements of this set that are not in the other container
+        """
+        return Bitset(self._index, self._mask & ~self._index.to_mask(other))
+
+    def intersection(self, other: Container[T]) -> 'Bitset[T]':
+        """
+
+        :param other: The container to intersect with
+        :return: The elements of this set that are also in the container
+        """
+        return Bitset(self._index, self._mask & self._index.to_mask(other))
+
+    def union(self, other: Collection[T]) -> AbstractSet[T]:
+        """
+
+        :param other: The collection to add to this set
+        :return: The union of both sets. This is a :class:`Bitset` if every
+            element of the other collection is indexed
+        """
+        other_mask = self._index.try_mask(other)
+        if other_mask is None:
+            return frozenset(self).union(other)
+        return Bitset(self._index, self._mask | other_mask)
+
+    def issubset(self, other: Container[T]) -> bool:
+        """
+
+        :param other: The container to check against
+        :return: ``True`` if every element of this set is in the container
+        """
+        return self._mask & ~self._index.to_mask(other) == 0
+
+    def issuperset(self, other: Collection[T]) -> bool:
+        """
+
+        :param other: The collection to check against
+        :return: ``True`` if every item in the collection is in this set
+        """
+        other_mask = self._index.try_mask(other)
+        return other_mask is not None and other_mask & ~self._mask == 0
+
+    @classmethod
+    def _from_iterable(cls, iterable: Iterable[T]) -> AbstractSet[T]:
+        """
+        Used by the set operators inherited from
+        :class:`collections.abc.Set`, which do not know about the index.
+
+        :param iterable: The elements of the new set
+        :return: A frozen set of the elements
+        """
+        return frozenset(iterable)
+
+    def __and__(self, other: AbstractSet[T]) -> AbstractSet[T]:
+        if isinstance(other, Bitset) and other.index is self._index:
+            return Bitset(self._index, self._mask & other.mask)
+        return super(Bitset, self).__and__(other)
+
+    def __or__(self, other: AbstractSet[T]) -> AbstractSet[T]:
+        if isinstance(other, Bitset) and other.index is self._index:
+            return Bitset(self._index, self._mask | other.mask)
+        return super(Bitset, self).__or__(other)
+
+    def __sub__(self, other: AbstractSet[T]) -> AbstractSet[T]:
+        if isinstance(other, Bitset) and other.index is self._index:
+            return Bitset(self._index, self._mask & ~other.mask)
+        return super(Bitset, self).__sub__(other)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Bitset) and other.index is self._index:
+            return self._mask == other.mask
+        return super(Bitset, self).__eq__(other)
+
+    def __contains__(self, item: object) -> bool:
+        position = self._index._get_position(item)
+        return position is not None and bool(self._mask >> position & 1)
+
+    def __iter__(self) -> Iterator[T]:
+        return self._index.members(self._mask)
+
+    def __len__(self) -> int:
+        if self._length is None:
+            self._length = popcount(self._mask)
+        return self._length
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(frozenset(self))
+        return self._hash
+
+    def __repr__(self) -> str:
+        return '{0}({1})'.format(self.__class__.__name__, set(self))
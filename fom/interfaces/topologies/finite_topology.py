@@ -86,6 +86,19 @@ class FiniteTopology(Topology[T], Generic[T], metaclass=abc.ABCMeta):
         """
         raise NotImplementedError()
 
+    @abc.abstractmethod
+    def minimal_neighborhood(self, point: T) -> Collection[T]:
+        """
+        Every point in a finite topology has a smallest open neighborhood,
+        which is the intersection of all open sets containing the point. This
+        intersection is open because there are finitely many open sets.
+
+        :param point: The point for which the minimal neighborhood is to be
+            obtained
+        :return: The smallest open set containing the point
+        """
+        raise NotImplementedError()
+
     @abc.abstractmethod
     def closure(self, subset: Container[T]) -> Collection[T]:
         """
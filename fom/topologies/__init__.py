@@ -10,7 +10,12 @@ topological space, is a set of elements :math:`S` and a set of sets
 
 """
 from .custom_topology import CustomTopology
-from .random_topology import RandomTopology
+from .bitset_topology import BitsetTopology
+from .boolean_matrix import BooleanMatrixEngine
+from .preorder_topology import PreorderTopology
+from .open_sets import count_open_sets
+from .generated_topology import generate_topology
+from .random_topology import RandomTopology, random_topologies
 from .relative_topology import RelativeTopology
 from .empty_topology import EmptyTopology
 from .finite_product_topology import FiniteProductTopology
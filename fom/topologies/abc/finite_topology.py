@@ -3,13 +3,12 @@ Base class for topologies with a finite number of elements
 """
 import abc
 from typing import Set, TypeVar, Union, Generic, Collection, Container
-from typing import Iterator, Tuple, cast, Iterable
+from typing import Iterator, Tuple, cast, Iterable, List, Optional
 from fom.topologies.finite_product_topology import FiniteProductTopology
 from fom.topologies.abc.topology import Topology as AbstractTopology
 from fom.interfaces import Topology
 from fom.interfaces import FiniteTopology as FiniteTopologyInterface
-from fom.identity_objects import EmptyCollection
-from functools import reduce
+from fom.bitsets import Bitset, ElementIndex
 import itertools
 
 T = TypeVar('T')
@@ -81,37 +80,47 @@ class FiniteTopology(
         """
         return self._Complement(self, subset)
 
+    def minimal_neighborhood(self, point: T) -> Collection[T]:
+        """
+
+        :param point: The point for which the minimal neighborhood is to be
+            obtained
+        :return: The intersection of all open sets containing the point
+        """
+        index, neighborhoods = self._neighborhood_index
+        return Bitset(index, neighborhoods[index.position(point)])
+
     def closure(self, subset: Container[T]) -> Collection[T]:
         """
+        A point is in the closure of a set iff every open neighborhood of the
+        point meets the set. It is enough to check the minimal neighborhood.
 
         :param subset: The subset for which the closure is to be calculated
         :return: The closure
         """
-        closed_sets_containing_subset = (
-            closed_set for closed_set in self.closed_sets
-            if self._collection_contains_container(closed_set, subset)
-        )
-        return reduce(
-            lambda x, y: self.Intersection(x, y),
-            closed_sets_containing_subset,
-            self.elements
-        )
+        index, neighborhoods = self._neighborhood_index
+        mask = index.to_mask(subset)
+        closure = 0
+        for position, neighborhood in enumerate(neighborhoods):
+            if neighborhood & mask:
+                closure |= 1 << position
+        return Bitset(index, closure)
 
     def interior(self, subset: Container[T]) -> Collection[T]:
         """
+        A point is in the interior of a set iff its minimal neighborhood lies
+        inside the set.
 
         :param subset: The subset for which the interior is to be calculated
         :return: The interior
         """
-        open_sets_containing_subset = (
-            open_set for open_set in self.open_sets
-            if self._collection_contains_container(open_set, subset)
-        )
-        return reduce(
-            lambda x, y: self.Union(x, y),
-            open_sets_containing_subset,
-            EmptyCollection()
-        )
+        index, neighborhoods = self._neighborhood_index
+        outside = index.full_mask ^ index.to_mask(subset)
+        interior = 0
+        for position, neighborhood in enumerate(neighborhoods):
+            if not neighborhood & outside:
+                interior |= 1 << position
+        return Bitset(index, interior)
 
     def boundary(self, subset: Container[T]) -> Collection[T]:
         """
@@ -134,23 +143,51 @@ class FiniteTopology(
     def _is_point(self, point_or_set: Union[T, Set[T]]) -> bool:
         return isinstance(point_or_set, next(iter(self.elements)).__class__)
 
-    def _collection_contains_container(
-            self, collection: Collection[T], container: Container[T]
-    ) -> bool:
+    @property
+    def _neighborhood_index(self) -> Tuple[ElementIndex[T], List[int]]:
+        """
+        The index of minimal neighborhoods is built on first use. Topologies
+        are not modified after construction, so the index is kept for the
+        lifetime of the topology.
+
+        :return: An index of the elements, and the mask of the minimal
+            neighborhood of each element in the order of the index
+        """
+        neighborhood_index = getattr(self, '_minimal_neighborhoods', None)
+        if neighborhood_index is None:
+            neighborhood_index = self._index_minimal_neighborhoods()
+            self._minimal_neighborhoods = neighborhood_index
+        return neighborhood_index
+
+    def _index_minimal_neighborhoods(
+            self
+    ) -> Tuple[ElementIndex[T], List[int]]:
         """
-        Checks that a collection contains a container. Define a collection as
-        containing a container if and only if no elements in the topology that
-        are not in the collection are in the container
 
-        :param collection:
-        :param container:
-        :return:
+        :return: A newly-built index of minimal neighborhoods, made by
+            scanning the open sets once
         """
-        elements_outside_container = {
-            element for element in self.elements
-            if element in collection and element not in container
-        }
-        return len(elements_outside_container) == 0
+        index = ElementIndex(self.elements)
+        return index, self._intersect_open_masks(index, (
+            index.to_mask(open_set) for open_set in self.open_sets
+        ))
+
+    @staticmethod
+    def _intersect_open_masks(
+            index: ElementIndex[T], open_masks: Iterable[int]
+    ) -> List[int]:
+        """
+
+        :param index: The index over which the masks are defined
+        :param open_masks: The masks of the open sets
+        :return: For each position in the index, the intersection of the open
+            sets containing the element at that position
+        """
+        neighborhoods = [index.full_mask] * len(index)
+        for open_mask in open_masks:
+            for position in index.positions(open_mask):
+                neighborhoods[position] &= open_mask
+        return neighborhoods
 
     def __repr__(self) -> str:
         """
@@ -396,74 +433,95 @@ class FiniteTopology(
                 self.__class__.__name__, self._topology, self._set
             )
 
-    class _OpenNeighborhoodsForPoint(Collection[Collection[T]]):
+    class _OpenNeighborhoods(Collection[Collection[T]]):
         """
-        The collection of open neighborhoods
+        The collection of open sets that contain a given open set. Membership
+        is decided with the index of minimal neighborhoods, since a set is
+        open iff it contains the minimal neighborhood of each of its points.
         """
         def __init__(
                 self,
-                topology: FiniteTopologyInterface[T],
-                point: T
+                topology: 'FiniteTopology[T]',
+                required_mask: int
         ) -> None:
+            """
+
+            :param topology: The topology in which neighborhoods are taken
+            :param required_mask: The mask of the smallest open set that each
+                neighborhood must contain
+            """
             self._topology = topology
-            self._point = point
+            self._index, self._neighborhoods = topology._neighborhood_index
+            self._required = required_mask
+            self._length = None  # type: Optional[int]
 
         def __iter__(self) -> Iterator[Collection[T]]:
+            """
+
+            :return: The open sets of the topology that contain every element
+                of the required set
+            """
+            required = tuple(self._index.members(self._required))
             return (
                 open_set for open_set in self._topology.open_sets
-                if self._point in open_set
+                if all(element in open_set for element in required)
             )
 
         def __len__(self) -> int:
             """
 
-            :return: The number of open neighborhoods
+            :return: The number of open neighborhoods. This is counted on
+                first use
             """
-            return len(frozenset(self))
+            if self._length is None:
+                self._length = sum(1 for _ in self)
+            return self._length
 
         def __contains__(self, item: object) -> bool:
             """
 
-            :param item: The open set to see if it is a neighborhood
-            :return:
+            :param item: The set to check
+            :return: ``True`` if the set is open and contains the required set
             """
-            return item in frozenset(self)
+            mask = self._index.try_mask(item)
+            if mask is None or self._required & ~mask:
+                return False
+            return all(
+                not self._neighborhoods[position] & ~mask
+                for position in self._index.positions(mask)
+            )
 
-    class _OpenNeighborhoodsForSet(Collection[Collection[T]]):
+    class _OpenNeighborhoodsForPoint(_OpenNeighborhoods):
+        """
+        The collection of open neighborhoods of a point. These are the open
+        sets containing the minimal neighborhood of the point.
+        """
         def __init__(
                 self,
-                topology: FiniteTopologyInterface[T],
-                container: Container[T]
+                topology: 'FiniteTopology[T]',
+                point: T
         ) -> None:
-            self._topology = topology
-            self._container = container
-
-        def __iter__(self) -> Iterator[Collection[T]]:
-            """
-
-            :return: The open neighborhoods
-            """
-            return (
-                open_set for open_set in self._topology.open_sets if
-                self._open_set_contains_container(open_set, self._container)
+            index, neighborhoods = topology._neighborhood_index
+            super(FiniteTopology._OpenNeighborhoodsForPoint, self).__init__(
+                topology, neighborhoods[index.position(point)]
             )
+            self._point = point
 
-        def __len__(self) -> int:
-            return len(frozenset(self))
-
-        def __contains__(self, item: object) -> bool:
-            return item in frozenset(self)
-
-        def _open_set_contains_container(
+    class _OpenNeighborhoodsForSet(_OpenNeighborhoods):
+        """
+        The collection of open neighborhoods of a set. These are the open sets
+        containing the union of the minimal neighborhoods of its points.
+        """
+        def __init__(
                 self,
-                open_set: Collection[T],
+                topology: 'FiniteTopology[T]',
                 container: Container[T]
-        ) -> bool:
-            closed_set_has_container = any(
-                element in container for element
-                in self._topology.complement(open_set))
-            all_elements_in_container = all(
-                element in container for element in open_set
+        ) -> None:
+            index, neighborhoods = topology._neighborhood_index
+            required = 0
+            for position in index.positions(index.to_mask(container)):
+                required |= neighborhoods[position]
+            super(FiniteTopology._OpenNeighborhoodsForSet, self).__init__(
+                topology, required
             )
-
-            return all_elements_in_container and not closed_set_has_container
+            self._container = container
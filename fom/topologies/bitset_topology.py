@@ -0,0 +1,282 @@
+"""
+Defines a finite topology whose open sets are stored as bitmasks. Each element
+is mapped to a bit position once on construction, so that complements,
+intersections, unions and subset tests on the open sets become single integer
+operations instead of membership checks against the elements.
+"""
+from fom.interfaces import FiniteTopology as FiniteTopologyInterface
+from fom.topologies.abc import FiniteTopology
+from fom.bitsets import Bitset, ElementIndex
+from fom.exceptions import InvalidOpenSets
+from typing import TypeVar, Union, Collection, Generic, Iterator, Container
+from typing import Iterable, List, Tuple, cast
+
+T = TypeVar('T')
+
+
+class BitsetTopology(FiniteTopology[T], Generic[T]):
+    """
+    Implements a finite topology where open sets and elements are given by the
+    user, with every open set stored as a bitmask over the elements. This
+    topology accepts the same arguments as
+    :class:`fom.topologies.CustomTopology`, and can be used in its place.
+
+    Sets returned by this topology are instances of :class:`fom.bitsets.Bitset`
+    which compare equal to ``frozenset`` instances with the same elements.
+    """
+    def __init__(
+            self, elements: Collection[T], open_sets: Collection[Collection[T]]
+    ) -> None:
+        """
+
+        :param elements: The set of elements in the topology
+        :param open_sets: The open sets in the topology
+        """
+        self._index = ElementIndex(elements)
+        self._open_masks = self._unique_masks(
+            self._index.to_mask(open_set) for open_set in open_sets
+        )
+
+        self._assert_first_axiom(self._index, self._open_masks)
+
+    @classmethod
+    def from_topology(
+            cls, topology: FiniteTopologyInterface[T]
+    ) -> 'BitsetTopology[T]':
+        """
+
+        :param topology: The finite topology to convert
+        :return: A bitset topology with the same elements and open sets
+        """
+        return cls(topology.elements, topology.open_sets)
+
+    @property
+    def elements(self) -> Collection[T]:
+        """
+
+        :return: The elements of the topology
+        """
+        return Bitset(self._index, self._index.full_mask)
+
+    @property
+    def open_sets(self) -> Collection[Collection[T]]:
+        """
+
+        :return: The open sets
+        """
+        return self._Family(self._index, self._open_masks)
+
+    @property
+    def closed_sets(self) -> Collection[Collection[T]]:
+        """
+
+        :return: The closed sets. Each closed set is the complement of an
+            open set
+        """
+        full_mask = self._index.full_mask
+        return self._Family(
+            self._index, tuple(full_mask ^ mask for mask in self._open_masks)
+        )
+
+    def get_open_neighborhoods(
+            self, point_or_set: Union[T, Container[T]]
+    ) -> Collection[Collection[T]]:
+        """
+
+        :param point_or_set: The point or set for which the open neighborhoods
+            are to be obtained
+        :return: The open sets containing the point or every element of the
+            set
+        """
+        if self._is_point(point_or_set):
+            mask = 1 << self._index.position(cast(T, point_or_set))
+        else:
+            mask = self._index.to_mask(cast(Container[T], point_or_set))
+
+        return self._Family(self._index, tuple(
+            open_mask for open_mask in self._open_masks
+            if open_mask & mask == mask
+        ))
+
+    def complement(self, subset: Container[T]) -> Collection[T]:
+        """
+
+        :param subset: The subset for which the complement is to be found
+        :return: The elements of the topology that are not in the subset
+        """
+        return Bitset(
+            self._index, self._index.full_mask ^ self._index.to_mask(subset)
+        )
+
+    def closure(self, subset: Container[T]) -> Collection[T]:
+        """
+        The closure is the complement of the union of all open sets that are
+        disjoint from the subset.
+
+        :param subset: The subset for which the closure is to be calculated
+        :return: The closure of the subset
+        """
+        return Bitset(self._index, self._closure_mask(
+            self._index.to_mask(subset)
+        ))
+
+    def interior(self, subset: Container[T]) -> Collection[T]:
+        """
+
+        :param subset: The subset for which the interior is to be calculated
+        :return: The union of all open sets contained in the subset
+        """
+        return Bitset(self._index, self._interior_mask(
+            self._index.to_mask(subset)
+        ))
+
+    def boundary(self, subset: Container[T]) -> Collection[T]:
+        """
+        The boundary is the intersection of the closure of the subset with the
+        closure of its complement. The closure of the complement is the
+        complement of the interior, so only one pass over the open sets is
+        needed per operator.
+
+        :param subset: The subset for which the boundary is to be calculated
+        :return: The boundary of the subset
+        """
+        mask = self._index.to_mask(subset)
+        return Bitset(
+            self._index, self._closure_mask(mask) & ~self._interior_mask(mask)
+        )
+
+    def _closure_mask(self, mask: int) -> int:
+        """
+
+        :param mask: The mask for which the closure is to be calculated
+        :return: The mask of the closure
+        """
+        disjoint_open_sets = 0
+        for open_mask in self._open_masks:
+            if open_mask & mask == 0:
+                disjoint_open_sets |= open_mask
+        return self._index.full_mask ^ disjoint_open_sets
+
+    def _interior_mask(self, mask: int) -> int:
+        """
+
+        :param mask: The mask for which the interior is to be calculated
+        :return: The mask of the interior
+        """
+        interior = 0
+        for open_mask in self._open_masks:
+            if open_mask & ~mask == 0:
+                interior |= open_mask
+        return interior
+
+    def _index_minimal_neighborhoods(
+            self
+    ) -> Tuple[ElementIndex[T], List[int]]:
+        """
+
+        :return: The index of minimal neighborhoods, built directly from the
+            stored open set masks
+        """
+        return self._index, self._intersect_open_masks(
+            self._index, self._open_masks
+        )
+
+    def _is_point(self, point_or_set: Union[T, Container[T]]) -> bool:
+        """
+
+        :param point_or_set: The object to check
+        :return: ``True`` if the object is an element of this topology
+        """
+        return point_or_set in self._index
+
+    @staticmethod
+    def _unique_masks(masks: Iterable[int]) -> Tuple[int, ...]:
+        """
+
+        :param masks: The masks from which duplicates are to be removed
+        :return: The masks in their original order, without duplicates
+        """
+        seen = set()
+        unique = []
+        for mask in masks:
+            if mask not in seen:
+                seen.add(mask)
+                unique.append(mask)
+        return tuple(unique)
+
+    @staticmethod
+    def _assert_first_axiom(
+            index: ElementIndex[T], open_masks: Tuple[int, ...]
+    ) -> None:
+        """
+
+        :param index: The index of the elements in the topology
+        :param open_masks: The masks of the open sets
+        :raises InvalidOpenSets: If the empty set or the set of elements is
+            not an open set
+        """
+        if 0 not in open_masks:
+            raise InvalidOpenSets(
+                'The set of open sets does not contain the empty set'
+            )
+
+        if index.full_mask not in open_masks:
+            raise InvalidOpenSets(
+                'The set of open sets does not contain the set of elements'
+            )
+
+    def __eq__(self, other: object) -> bool:
+        """
+
+        :param other: The topology against which this is to be compared
+        :return: ``True`` if both topologies have the same elements and the
+            same open sets
+        """
+        if not isinstance(other, FiniteTopologyInterface):
+            return False
+        if frozenset(self._index) != frozenset(other.elements):
+            return False
+
+        other_masks = frozenset(
+            self._index.to_mask(open_set) for open_set in other.open_sets
+        )
+        return other_masks == frozenset(self._open_masks)
+
+    class _Family(Collection[Collection[T]]):
+        """
+        A collection of sets, each stored as a mask over the same index.
+        Length is constant time, and membership takes time proportional to the
+        size of the set being tested.
+        """
+        def __init__(
+                self, index: ElementIndex[T], masks: Tuple[int, ...]
+        ) -> None:
+            """
+
+            :param index: The index over which the masks are defined
+            :param masks: The masks of the sets in this family, without
+                duplicates
+            """
+            self._index = index
+            self._masks = masks
+            self._mask_set = frozenset(masks)
+
+        def __iter__(self) -> Iterator[Collection[T]]:
+            return (Bitset(self._index, mask) for mask in self._masks)
+
+        def __len__(self) -> int:
+            return len(self._masks)
+
+        def __contains__(self, item: object) -> bool:
+            mask = self._index.try_mask(item)
+            return mask is not None and mask in self._mask_set
+
+        def __eq__(self, other: object) -> bool:
+            if not isinstance(other, Iterable):
+                return False
+            return set(self) == set(cast(Iterable[Collection[T]], other))
+
+        def __repr__(self) -> str:
+            return '{0}({1})'.format(
+                self.__class__.__name__, [set(item) for item in self]
+            )
@@ -0,0 +1,173 @@
+"""
+Describes a vectorized engine for computing closures, interiors and boundaries
+of many subsets of a finite topology at once. The open sets of the topology
+are stored as a boolean matrix with one row per open set and one column per
+element, and a batch of subsets is a boolean matrix with one row per subset.
+
+This engine requires :mod:`numpy`, which is an optional dependency of this
+library.
+"""
+from fom.interfaces import FiniteTopology
+from fom.bitsets import ElementIndex
+from typing import Any, Container, FrozenSet, Generic, Iterable
+from typing import List, Tuple, TypeVar
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+T = TypeVar('T')
+
+
+class BooleanMatrixEngine(Generic[T]):
+    """
+    Stores the open sets of a finite topology as a boolean matrix of shape
+    ``(number of open sets, number of elements)``. Queries are boolean matrices
+    of shape ``(number of subsets, number of elements)``, where column ``j``
+    corresponds to ``engine.elements[j]``.
+
+    An open set is contained in a subset iff none of its elements lie outside
+    the subset. Counting those elements for every pair of subset and open set
+    is a single matrix product, so the containment tests for a whole batch
+    are vectorized.
+    """
+    def __init__(
+            self, topology: FiniteTopology[T], chunk_size: int=4096
+    ) -> None:
+        """
+
+        :param topology: The topology for which queries are to be answered
+        :param chunk_size: The maximum number of subsets processed in one
+            matrix product. This bounds the memory used by large batches
+        :raises ImportError: If :mod:`numpy` is not installed
+        """
+        if np is None:
+            raise ImportError(
+                'The boolean matrix engine requires numpy to be installed'
+            )
+        self._index = ElementIndex(topology.elements)
+        self._chunk_size = chunk_size
+
+        open_sets = np.zeros(
+            (len(topology.open_sets), len(self._index)), dtype=bool
+        )
+        for row, open_set in enumerate(topology.open_sets):
+            open_sets[row, list(
+                self._index.positions(self._index.to_mask(open_set))
+            )] = True
+
+        self._dtype = np.float32 if max(open_sets.shape) < 2 ** 24 \
+            else np.float64
+        self._open_sets = open_sets.astype(self._dtype)
+
+    @property
+    def elements(self) -> Tuple[T, ...]:
+        """
+
+        :return: The elements of the topology, in the order of the columns of
+            the query matrices
+        """
+        return tuple(self._index)
+
+    @property
+    def open_sets(self) -> Any:
+        """
+
+        :return: The boolean matrix of open sets
+        """
+        return self._open_sets.astype(bool)
+
+    def to_matrix(self, subsets: Iterable[Container[T]]) -> Any:
+        """
+
+        :param subsets: The subsets to convert
+        :return: A boolean matrix with one row per subset
+        """
+        rows = [
+            list(self._index.positions(self._index.to_mask(subset)))
+            for subset in subsets
+        ]  # type: List[List[int]]
+        matrix = np.zeros((len(rows), len(self._index)), dtype=bool)
+        for row, positions in enumerate(rows):
+            matrix[row, positions] = True
+        return matrix
+
+    def to_sets(self, matrix: Any) -> List[FrozenSet[T]]:
+        """
+
+        :param matrix: A boolean matrix with one row per subset
+        :return: The subsets represented by the rows of the matrix
+        """
+        elements = self.elements
+        return [
+            frozenset(elements[column] for column in np.flatnonzero(row))
+            for row in np.asarray(matrix, dtype=bool)
+        ]
+
+    def interiors(self, subsets: Any) -> Any:
+        """
+
+        :param subsets: A boolean matrix with one row per subset
+        :return: A boolean matrix whose rows are the interiors of the subsets
+        """
+        return self._interiors(self._as_matrix(subsets))
+
+    def closures(self, subsets: Any) -> Any:
+        """
+        The closure of a subset is the complement of the interior of its
+        complement.
+
+        :param subsets: A boolean matrix with one row per subset
+        :return: A boolean matrix whose rows are the closures of the subsets
+        """
+        return ~self._interiors(~self._as_matrix(subsets))
+
+    def boundaries(self, subsets: Any) -> Any:
+        """
+        The boundary of a subset is its closure without its interior.
+
+        :param subsets: A boolean matrix with one row per subset
+        :return: A boolean matrix whose rows are the boundaries of the
+            subsets
+        """
+        matrix = self._as_matrix(subsets)
+        return ~self._interiors(~matrix) & ~self._interiors(matrix)
+
+    def _as_matrix(self, subsets: Any) -> Any:
+        """
+
+        :param subsets: The query matrix
+        :return: The query matrix as a two-dimensional boolean array
+        :raises ValueError: If the query matrix does not have one column per
+            element
+        """
+        matrix = np.asarray(subsets, dtype=bool)
+        if matrix.ndim != 2 or matrix.shape[1] != len(self._index):
+            raise ValueError(
+                'Expected a matrix with %d columns, got shape %s' % (
+                    len(self._index), matrix.shape
+                )
+            )
+        return matrix
+
+    def _interiors(self, matrix: Any) -> Any:
+        """
+
+        :param matrix: A two-dimensional boolean query matrix
+        :return: The interiors of the rows of the matrix
+        """
+        result = np.empty(matrix.shape, dtype=bool)
+        for start in range(0, matrix.shape[0], self._chunk_size):
+            chunk = matrix[start:start + self._chunk_size]
+            outside = (~chunk).astype(self._dtype)
+            contained = (outside @ self._open_sets.T) == 0
+            result[start:start + self._chunk_size] = (
+                contained.astype(self._dtype) @ self._open_sets
+            ) > 0
+        return result
+
+    def __repr__(self) -> str:
+        return '{0}(elements={1}, open_sets={2})'.format(
+            self.__class__.__name__, self.elements, self._open_sets.shape[0]
+        )
@@ -6,7 +6,8 @@ from fom.interfaces import FiniteTopology as FiniteTopologyInterface
 from fom.interfaces import Topology as TopologyInterface
 from fom.topologies.abc import FiniteTopology
 from typing import TypeVar, Union, Collection, Generic, Iterator, Tuple
-from typing import Container, Iterable, cast
+from typing import Container, Iterable, List, cast
+from fom.bitsets import ElementIndex
 from fom.exceptions import InvalidOpenSets
 
 T = TypeVar('T')
@@ -29,17 +30,28 @@ class CustomTopology(FiniteTopology[T], Generic[T]):
 
     """
     def __init__(
-            self, elements: Collection[T], open_sets: Collection[Collection[T]]
+            self,
+            elements: Collection[T],
+            open_sets: Collection[Collection[T]],
+            validate: bool=False
     ) -> None:
         """
 
         :param elements: The set of elements in the topology
         :param open_sets: The open sets in the topology
+        :param validate: If ``True``, check that the open sets are closed
+            under unions and intersections. By default, only the presence of
+            the empty set and the set of elements is checked
+        :raises InvalidOpenSets: If the open sets do not satisfy the axioms
+            of a topology
         """
         self._elements = elements
         self._open_sets = open_sets
 
         self._assert_first_axiom(elements, open_sets)
+        if validate:
+            self._minimal_neighborhoods = \
+                self._assert_second_and_third_axioms(elements, open_sets)
 
     @property
     def elements(self) -> Collection[T]:
@@ -149,6 +161,77 @@ class CustomTopology(FiniteTopology[T], Generic[T]):
                 'The set of open sets not contain the set of elements'
             )
 
+    @classmethod
+    def _assert_second_and_third_axioms(
+            cls,
+            elements: Collection[T],
+            open_sets: Collection[Collection[T]]
+    ) -> Tuple[ElementIndex[T], List[int]]:
+        """
+        Check that the open sets are closed under intersections and unions.
+        Open sets are stored as bitmasks in a hash set, and the minimal
+        neighborhood :math:`U_x` of each point is computed as the intersection
+        of the open sets containing it. Then
+
+        * The open sets are closed under intersection iff every :math:`U_x`
+          is an open set. Every open set contains the minimal neighborhoods
+          of its points, so it is also the union of them.
+        * The open sets are closed under union iff :math:`O \\cup U_x` is an
+          open set for every open set :math:`O` and point :math:`x`. Any union
+          of open sets can be built up this way.
+
+        This takes time proportional to the number of open sets times the
+        number of elements, instead of the square of the number of open sets.
+
+        :param elements: The elements of the topology
+        :param open_sets: The open sets of the topology
+        :return: The index of minimal neighborhoods for the topology
+        :raises InvalidOpenSets: With the first pair of open sets whose
+            intersection or union is not open
+        """
+        index = ElementIndex(elements)
+        open_masks = []  # type: List[int]
+        for open_set in open_sets:
+            mask = index.try_mask(open_set)
+            if mask is None:
+                raise InvalidOpenSets(
+                    'The open set %s is not a subset of the elements %s' % (
+                        open_set, elements
+                    )
+                )
+            open_masks.append(mask)
+        open_mask_set = frozenset(open_masks)
+        neighborhoods = cls._intersect_open_masks(index, open_masks)
+
+        for position, neighborhood in enumerate(neighborhoods):
+            if neighborhood in open_mask_set:
+                continue
+            containing = (mask for mask in open_masks if mask >> position & 1)
+            intersection = next(containing)
+            for mask in containing:
+                if intersection & mask not in open_mask_set:
+                    raise InvalidOpenSets(
+                        'The intersection of the open sets %s and %s is not '
+                        'an open set' % (
+                            set(index.members(intersection)),
+                            set(index.members(mask))
+                        )
+                    )
+                intersection &= mask
+
+        for mask in open_masks:
+            for position in index.positions(index.full_mask & ~mask):
+                if mask | neighborhoods[position] not in open_mask_set:
+                    raise InvalidOpenSets(
+                        'The union of the open sets %s and %s is not an open '
+                        'set' % (
+                            set(index.members(mask)),
+                            set(index.members(neighborhoods[position]))
+                        )
+                    )
+
+        return index, neighborhoods
+
     def __mul__(self, other: TopologyInterface[Y]) -> TopologyInterface[Tuple[T, Y]]:
         return self
 
@@ -72,6 +72,21 @@ class FiniteProductTopology(FPTInterface[X, Y], Generic[X, Y]):
 
         return open_sets
 
+    def minimal_neighborhood(self, point: Tuple[X, Y]) -> Set[Tuple[X, Y]]:
+        """
+
+        :param point: The point for which the minimal neighborhood is to be
+            found
+        :return: The product of the minimal neighborhoods of the coordinates
+            of the point in their respective topologies
+        """
+        first, second = point
+        neighborhood = frozenset(product(
+            self._first.minimal_neighborhood(first),
+            self._second.minimal_neighborhood(second)
+        ))  # type: Set[Tuple[X, Y]]
+        return neighborhood
+
     def complement(self, set_: Set[Tuple[X, Y]]) -> Set[Tuple[X, Y]]:
         """
 
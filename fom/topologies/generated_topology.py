@@ -0,0 +1,80 @@
+"""
+Describes how to generate the smallest topology containing a family of sets.
+The family is called a subbasis of the generated topology. The open sets of
+the generated topology are the unions of finite intersections of the sets in
+the subbasis, and there can be exponentially many of them.
+
+Instead of closing the family under unions and intersections, the minimal
+neighborhood :math:`U_x` of each point is found directly, as the intersection
+of the sets in the subbasis that contain the point. The minimal neighborhoods
+determine the topology, which is returned as a
+:class:`fom.topologies.PreorderTopology`.
+"""
+from fom.topologies.preorder_topology import PreorderTopology
+from fom.bitsets import ElementIndex
+from fom.exceptions import InvalidSubset
+from typing import Collection, Dict, Iterable, List, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+def generate_topology(
+        elements: Collection[T], subbasis: Iterable[Collection[T]]
+) -> PreorderTopology[T]:
+    """
+    Generate the coarsest topology on a set of elements in which every set
+    of the subbasis is open. This takes time proportional to the total size
+    of the sets in the subbasis, plus the square of the number of elements.
+
+    :param elements: The elements of the topology
+    :param subbasis: The sets that are to be open in the topology
+    :return: The topology generated by the subbasis. A point that is in no
+        set of the subbasis only has the set of elements as a neighborhood
+    :raises InvalidSubset: If a set in the subbasis is not a subset of the
+        elements
+    """
+    index = ElementIndex(elements)
+    neighborhoods = [index.full_mask] * len(index)
+
+    for subset in subbasis:
+        mask = index.try_mask(subset)
+        if mask is None:
+            raise InvalidSubset(
+                'The set %s is not a subset of the elements %s' % (
+                    subset, elements
+                )
+            )
+        for position in index.positions(mask):
+            neighborhoods[position] &= mask
+
+    return PreorderTopology(index, {
+        element: tuple(index.members(below))
+        for element, below in zip(index, _reduce(index, neighborhoods))
+    })
+
+
+def _reduce(index: ElementIndex[T], neighborhoods: List[int]) -> List[int]:
+    """
+    Remove the edges of the preorder that are implied by transitivity, so
+    that walking the preorder takes time linear in the size of a minimal
+    neighborhood rather than quadratic.
+
+    :param index: The index of the elements
+    :param neighborhoods: The mask of the minimal neighborhood of each point
+    :return: For each point, the mask of the points on the same cycle, and of
+        the points directly below it, which are the greatest points strictly
+        below it
+    """
+    classes = {}  # type: Dict[int, int]
+    for position, neighborhood in enumerate(neighborhoods):
+        classes[neighborhood] = classes.get(neighborhood, 0) | 1 << position
+
+    reduced = []
+    for position, neighborhood in enumerate(neighborhoods):
+        cycle = classes[neighborhood]
+        strictly_below = neighborhood & ~cycle
+        covered = 0
+        for lower in index.positions(strictly_below):
+            covered |= neighborhoods[lower] & ~classes[neighborhoods[lower]]
+        reduced.append(cycle & ~(1 << position) | strictly_below & ~covered)
+    return reduced
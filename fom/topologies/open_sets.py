@@ -0,0 +1,373 @@
+"""
+Describes the open sets of a finite topology without materializing them. The
+open sets of a finite topology are the down-closed sets of its specialization
+preorder, and there can be exponentially many of them. They are generated
+lazily here, in a canonical order, by walking a binary decision tree.
+
+Each node of the tree has a set of undecided points. The branches of a node
+decide whether the first undecided point, in the canonical order of the
+elements, is in the open set. Excluding the point excludes every point in its
+closure, and including the point includes every point in its minimal
+neighborhood. Every leaf of the tree is a distinct open set, so a position in
+the enumeration is given either by its rank or by the last open set that was
+generated. Either can be stored, and the enumeration resumed from it later,
+possibly by another process.
+
+The number of leaves below each node is counted by splitting the undecided
+points into unrelated components and memoizing the counts, so the open sets
+can be counted, and a rank can be found, without generating the open sets
+that come before it.
+"""
+from collections import namedtuple
+from fom.interfaces import FiniteTopology
+from fom.bitsets import ElementIndex, popcount
+from typing import Collection, Dict, FrozenSet, Generic, Iterator, List
+from typing import Optional
+from typing import Tuple, TypeVar, Union, cast
+
+T = TypeVar('T')
+DecisionMasks = Tuple[ElementIndex, List[int], List[int]]
+
+OpenSetCursor = namedtuple('OpenSetCursor', ['rank', 'open_set'])
+OpenSetCursor.__doc__ = """
+A position in the enumeration of open sets. The rank is the number of open
+sets that come before the open set in the canonical order.
+"""
+
+
+class LazyOpenSets(Collection[FrozenSet[T]], Generic[T]):
+    """
+    The open sets of a finite topology, generated on demand in canonical
+    order. Only the minimal neighborhood and the closure of each point are
+    stored, which take at most quadratic memory in the number of elements.
+
+    The canonical order of the elements is their sorted order if they can be
+    sorted, and the order of their representations otherwise. This keeps the
+    order of the open sets the same between processes.
+    """
+    def __init__(self, topology: FiniteTopology[T]) -> None:
+        """
+
+        :param topology: The topology whose open sets are to be generated
+        """
+        self._topology = topology
+        self._masks = None  # type: Optional[DecisionMasks]
+        self._counts = {0: 1}  # type: Dict[int, int]
+
+    @property
+    def elements(self) -> Tuple[T, ...]:
+        """
+
+        :return: The elements of the topology, in canonical order
+        """
+        return tuple(self._decision_masks[0])
+
+    def iter_from(
+            self, start: Union[int, OpenSetCursor]=0
+    ) -> 'OpenSetIterator[T]':
+        """
+
+        :param start: Either the rank of the first open set to generate, or a
+            cursor obtained from an earlier iterator. Generation resumes
+            after the open set of the cursor
+        :return: An iterator over the open sets from the given position
+        """
+        if isinstance(start, OpenSetCursor):
+            return OpenSetIterator(self, start.rank, self._path_to(
+                self._decision_masks[0].to_mask(start.open_set)
+            ), True)
+        return OpenSetIterator(self, start, self._path_to_rank(start), False)
+
+    def count(self) -> int:
+        """
+        Count the open sets without generating them. Unlike ``len``, the
+        count is not limited to the size of a machine integer.
+
+        :return: The number of open sets
+        """
+        return self._count(self._decision_masks[0].full_mask)
+
+    def _path_to(self, open_mask: int) -> List[Tuple[int, int]]:
+        """
+
+        :param open_mask: The mask of an open set
+        :return: The nodes at which the path from the root of the decision
+            tree to the leaf of the open set excludes a point. These are the
+            nodes at which the enumeration can branch off
+        """
+        index, neighborhoods, closures = self._decision_masks
+        undecided, chosen = index.full_mask, 0
+        path = []
+        while undecided:
+            pivot = (undecided & -undecided).bit_length() - 1
+            if open_mask >> pivot & 1:
+                undecided &= ~neighborhoods[pivot]
+                chosen |= neighborhoods[pivot]
+            else:
+                path.append((undecided, chosen))
+                undecided &= ~closures[pivot]
+        path.append((0, chosen))
+        return path
+
+    def _path_to_rank(self, rank: int) -> List[Tuple[int, int]]:
+        """
+        Walk down the decision tree to the leaf with the given rank. The
+        number of leaves under each node is counted, so subtrees that end
+        before the rank are skipped over without being visited.
+
+        :param rank: The rank of the leaf
+        :return: The nodes at which the path to the leaf excludes a point,
+            followed by the leaf, or an empty path if there are not enough
+            open sets
+        """
+        index, neighborhoods, closures = self._decision_masks
+        undecided, chosen = index.full_mask, 0
+        if rank < 0 or rank >= self._count(undecided):
+            return []
+
+        path = []
+        while undecided:
+            pivot = (undecided & -undecided).bit_length() - 1
+            excluded = undecided & ~closures[pivot]
+            excluded_count = self._count(excluded)
+            if rank < excluded_count:
+                path.append((undecided, chosen))
+                undecided = excluded
+            else:
+                rank -= excluded_count
+                undecided &= ~neighborhoods[pivot]
+                chosen |= neighborhoods[pivot]
+        path.append((0, chosen))
+        return path
+
+    def _count(self, undecided: int) -> int:
+        """
+        Count the down-closed subsets of a set of points, which is the number
+        of leaves below a node of the decision tree. The points are split
+        into components that are unrelated to each other, whose counts
+        multiply. Each component is split at the point related to the most
+        other points, into the down-closed sets that exclude the point, and
+        those that include it. Counts are memoized by the set of points.
+
+        :param undecided: The mask of the points
+        :return: The number of down-closed subsets of the points
+        """
+        counts = self._counts
+        splits = {}  # type: Dict[int, Tuple[bool, List[int]]]
+        stack = [undecided]
+        while stack:
+            mask = stack[-1]
+            if mask in counts:
+                stack.pop()
+                continue
+            if mask not in splits:
+                splits[mask] = self._split(mask)
+            is_product, parts = splits[mask]
+            missing = [part for part in parts if part not in counts]
+            if missing:
+                stack.extend(missing)
+                continue
+
+            stack.pop()
+            if is_product:
+                count = 1
+                for part in parts:
+                    count *= counts[part]
+            else:
+                count = sum(counts[part] for part in parts)
+            counts[mask] = count
+            del splits[mask]
+        return counts[undecided]
+
+    def _split(self, mask: int) -> Tuple[bool, List[int]]:
+        """
+
+        :param mask: The mask of a non-empty set of points
+        :return: ``True`` and the components of the points if there is more
+            than one component, otherwise ``False`` and the points left after
+            excluding and including a pivot point
+        """
+        index, neighborhoods, closures = self._decision_masks
+        positions = list(index.positions(mask))
+        comparable = {
+            position: (neighborhoods[position] | closures[position]) & mask
+            for position in positions
+        }
+
+        lowest = positions[0]
+        component = comparable[lowest]
+        frontier = component & ~(1 << lowest)
+        while frontier:
+            position = (frontier & -frontier).bit_length() - 1
+            frontier &= frontier - 1
+            new_points = comparable[position] & ~component
+            component |= new_points
+            frontier |= new_points
+
+        if component != mask:
+            return True, [component, mask & ~component]
+
+        pivot = max(positions, key=lambda position: popcount(
+            comparable[position]
+        ))
+        return False, [
+            mask & ~closures[pivot], mask & ~neighborhoods[pivot]
+        ]
+
+    @property
+    def _decision_masks(self) -> DecisionMasks:
+        """
+
+        :return: The index of the elements in canonical order, and the masks
+            of the minimal neighborhood and closure of each element. These
+            are computed on first use
+        """
+        if self._masks is None:
+            index = ElementIndex(self._canonical_order(self._topology))
+            neighborhoods = [
+                index.to_mask(self._topology.minimal_neighborhood(element))
+                for element in index
+            ]
+            closures = [0] * len(index)
+            for position, neighborhood in enumerate(neighborhoods):
+                for lower in index.positions(neighborhood):
+                    closures[lower] |= 1 << position
+            self._masks = (index, neighborhoods, closures)
+        return self._masks
+
+    @staticmethod
+    def _canonical_order(topology: FiniteTopology[T]) -> List[T]:
+        """
+
+        :param topology: The topology whose elements are to be ordered
+        :return: The elements in canonical order
+        """
+        try:
+            return sorted(topology.elements)
+        except TypeError:
+            return sorted(topology.elements, key=repr)
+
+    def __iter__(self) -> Iterator[FrozenSet[T]]:
+        return self.iter_from(0)
+
+    def __len__(self) -> int:
+        """
+
+        :return: The number of open sets. See :meth:`count`
+        """
+        return self.count()
+
+    def __contains__(self, item: object) -> bool:
+        """
+
+        :param item: The set to check
+        :return: ``True`` if the set contains the minimal neighborhood of each
+            of its points
+        """
+        collection = cast(Collection[T], item)
+        try:
+            return all(
+                element in self._topology.elements and all(
+                    neighbor in collection for neighbor in
+                    self._topology.minimal_neighborhood(element)
+                ) for element in collection
+            )
+        except TypeError:
+            return False
+
+    def __repr__(self) -> str:
+        return '{0}(topology={1})'.format(
+            self.__class__.__name__, self._topology
+        )
+
+
+class OpenSetIterator(Iterator[FrozenSet[T]], Generic[T]):
+    """
+    Iterates over the open sets of a :class:`LazyOpenSets` in canonical order.
+    The :attr:`cursor` of the iterator records the last open set that was
+    generated, and can be passed to :meth:`LazyOpenSets.iter_from` to resume.
+    """
+    def __init__(
+            self,
+            open_sets: LazyOpenSets[T],
+            rank: int,
+            path: List[Tuple[int, int]],
+            generated: bool
+    ) -> None:
+        """
+
+        :param open_sets: The open sets being iterated over
+        :param rank: The rank of the leaf at the end of the path
+        :param path: The nodes on the path from the root of the decision tree
+            to a leaf at which a point is excluded, followed by the leaf
+        :param generated: ``True`` if the open set at the leaf has already
+            been generated, in which case iteration starts after it
+        """
+        self._open_sets = open_sets
+        self._rank = rank
+        self._path = path
+        self._generated = generated
+        self._cursor = None  # type: Optional[OpenSetCursor]
+
+    @property
+    def cursor(self) -> Optional[OpenSetCursor]:
+        """
+
+        :return: The position of the last open set generated by this
+            iterator, or ``None`` if nothing has been generated yet
+        """
+        return self._cursor
+
+    def _advance(self) -> bool:
+        """
+        Move to the next leaf of the decision tree.
+
+        :return: ``True`` if there is a next leaf, otherwise ``False``
+        """
+        if not self._generated:
+            self._generated = True
+            return bool(self._path)
+        if not self._path:
+            return False
+
+        _, neighborhoods, closures = self._open_sets._decision_masks
+        self._path.pop()
+        if not self._path:
+            return False
+
+        undecided, chosen = self._path.pop()
+        pivot = (undecided & -undecided).bit_length() - 1
+        undecided &= ~neighborhoods[pivot]
+        chosen |= neighborhoods[pivot]
+        while undecided:
+            self._path.append((undecided, chosen))
+            pivot = (undecided & -undecided).bit_length() - 1
+            undecided &= ~closures[pivot]
+        self._path.append((0, chosen))
+        self._rank += 1
+        return True
+
+    def __next__(self) -> FrozenSet[T]:
+        if not self._advance():
+            raise StopIteration()
+        index = self._open_sets._decision_masks[0]
+        open_set = frozenset(index.members(self._path[-1][1]))
+        self._cursor = OpenSetCursor(self._rank, open_set)
+        return open_set
+
+    def __iter__(self) -> 'OpenSetIterator[T]':
+        return self
+
+
+def count_open_sets(topology: FiniteTopology[T]) -> int:
+    """
+    Count the open sets of a finite topology from the minimal neighborhoods
+    of its points, without generating the open sets.
+
+    :param topology: The topology whose open sets are to be counted
+    :return: The number of open sets
+    """
+    open_sets = topology.open_sets
+    if isinstance(open_sets, LazyOpenSets):
+        return open_sets.count()
+    return LazyOpenSets(topology).count()
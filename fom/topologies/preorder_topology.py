@@ -0,0 +1,411 @@
+"""
+Defines a finite topology by its specialization preorder. In a finite
+topology, a point :math:`y` specializes a point :math:`x`, written
+:math:`y \\leq x`, iff :math:`y` is in every open set containing :math:`x`.
+Equivalently, :math:`y` is in the minimal neighborhood :math:`U_x`.
+
+The topology can be recovered from the preorder: a set is open iff it is
+down-closed, :math:`U_x` is the set of points below :math:`x`, and the closure
+of a set is the set of points above some point in the set. The number of open
+sets can be exponential in the number of points, but the preorder takes at
+most quadratic memory.
+"""
+from fom.interfaces import FiniteTopology as FiniteTopologyInterface
+from fom.topologies.abc import FiniteTopology
+from fom.topologies.custom_topology import CustomTopology
+from fom.topologies.open_sets import LazyOpenSets
+from fom.bitsets import ElementIndex
+from fom.exceptions import InvalidSubset
+from typing import TypeVar, Union, Collection, Generic, Iterator, Container
+from typing import FrozenSet, Iterable, List, Mapping, Optional, Set
+from typing import Tuple, Type, cast
+
+T = TypeVar('T')
+
+
+class PreorderTopology(FiniteTopology[T], Generic[T]):
+    """
+    Implements a finite topology that stores only the specialization preorder
+    of its points, as a directed graph. An edge from :math:`x` to :math:`y`
+    means that :math:`y \\leq x`. The graph does not need to be transitively
+    closed, and may contain cycles. Points on a cycle have the same open
+    neighborhoods, and so are topologically indistinguishable.
+
+    Closures, interiors and minimal neighborhoods are found by walking the
+    graph, in time linear in the number of points and edges.
+    """
+    def __init__(
+            self,
+            elements: Iterable[T],
+            below: Mapping[T, Iterable[T]]
+    ) -> None:
+        """
+
+        :param elements: The elements of the topology
+        :param below: A mapping from elements to the elements directly below
+            them in the specialization preorder. Elements that are missing
+            from the mapping are only below themselves, unless they are below
+            another element
+        :raises InvalidSubset: If the mapping refers to something that is
+            not an element
+        """
+        self._index = ElementIndex(elements)
+
+        below_lists = [[] for _ in self._index]  # type: List[List[int]]
+        for upper, lower_elements in below.items():
+            upper_position = self._position(upper)
+            below_lists[upper_position].extend(
+                self._position(lower) for lower in lower_elements
+            )
+
+        self._set_relations(below_lists)
+
+    def _set_relations(self, below_lists: List[List[int]]) -> None:
+        """
+        Store the edges of the preorder, once the elements are indexed.
+
+        :param below_lists: For each position, the positions of the elements
+            directly below the element at that position
+        """
+        self._element_set = frozenset(self._index)
+
+        above_lists = [[] for _ in self._index]  # type: List[List[int]]
+        for upper_position, lower_positions in enumerate(below_lists):
+            for lower_position in lower_positions:
+                above_lists[lower_position].append(upper_position)
+
+        self._below = tuple(
+            tuple(lower for lower in lower_positions if lower != upper)
+            for upper, lower_positions in enumerate(below_lists)
+        )
+        self._above = tuple(
+            tuple(upper for upper in upper_positions if upper != lower)
+            for lower, upper_positions in enumerate(above_lists)
+        )
+        self._open_sets = self._OpenSets(self)
+
+    @classmethod
+    def from_topology(
+            cls, topology: FiniteTopologyInterface[T]
+    ) -> 'PreorderTopology[T]':
+        """
+
+        :param topology: The finite topology to convert
+        :return: A topology with the same open sets, stored as the
+            specialization preorder of the given topology
+        """
+        return cls(topology.elements, {
+            element: topology.minimal_neighborhood(element)
+            for element in topology.elements
+        })
+
+    def to_topology(
+            self,
+            topology_class: Type[FiniteTopologyInterface]=CustomTopology
+    ) -> FiniteTopologyInterface[T]:
+        """
+        Materialize every open set of this topology. This can take time and
+        memory exponential in the number of elements.
+
+        :param topology_class: A topology that is constructed from a
+            collection of elements and a collection of open sets, like
+            :class:`fom.topologies.CustomTopology` or
+            :class:`fom.topologies.BitsetTopology`
+        :return: A topology of the given class with the same open sets as
+            this topology
+        """
+        return topology_class(self._element_set, frozenset(
+            frozenset(open_set) for open_set in self.open_sets
+        ))
+
+    @property
+    def elements(self) -> FrozenSet[T]:
+        """
+
+        :return: The elements of the topology
+        """
+        return self._element_set
+
+    @property
+    def open_sets(self) -> Collection[Collection[T]]:
+        """
+
+        :return: The open sets of the topology. These are the down-closed
+            sets of the preorder, which are generated in canonical order when
+            iterated over. See :class:`fom.topologies.open_sets.LazyOpenSets`
+        """
+        return self._open_sets
+
+    def get_open_neighborhoods(
+            self, point_or_set: Union[T, Container[T]]
+    ) -> Collection[Collection[T]]:
+        """
+
+        :param point_or_set: The point or set for which the open neighborhoods
+            are to be obtained
+        :return: The open sets that contain the point, or every point in the
+            set
+        """
+        if self._is_point(point_or_set):
+            positions = [self._index.position(cast(T, point_or_set))]
+        else:
+            positions = self._positions_in(cast(Container[T], point_or_set))
+
+        return self._OpenNeighborhoods(
+            self, self._members(self._reach(positions, self._below))
+        )
+
+    def minimal_neighborhood(self, point: T) -> FrozenSet[T]:
+        """
+
+        :param point: The point for which the minimal neighborhood is to be
+            found
+        :return: The set of points below the point in the preorder
+        """
+        return self._members(
+            self._reach([self._index.position(point)], self._below)
+        )
+
+    def closure(self, subset: Container[T]) -> FrozenSet[T]:
+        """
+
+        :param subset: The subset for which the closure is to be calculated
+        :return: The set of points above some point of the subset
+        """
+        return self._members(
+            self._reach(self._positions_in(subset), self._above)
+        )
+
+    def interior(self, subset: Container[T]) -> FrozenSet[T]:
+        """
+        A point is in the interior of a set iff no point below it is outside
+        the set. The interior is therefore the complement of the closure of
+        the complement.
+
+        :param subset: The subset for which the interior is to be calculated
+        :return: The interior of the subset
+        """
+        return self._element_set.difference(
+            self._members(self._reach(self._positions_outside(subset),
+                                      self._above))
+        )
+
+    def boundary(self, subset: Container[T]) -> FrozenSet[T]:
+        """
+
+        :param subset: The subset for which the boundary is to be calculated
+        :return: The points of the closure that are not in the interior
+        """
+        return self.closure(subset).difference(self.interior(subset))
+
+    def complement(self, subset: Container[T]) -> FrozenSet[T]:
+        """
+
+        :param subset: The subset for which the complement is to be found
+        :return: The elements that are not in the subset
+        """
+        return self._members(self._positions_outside(subset))
+
+    def is_down_closed(self, subset: Collection[T]) -> bool:
+        """
+
+        :param subset: The set to check
+        :return: ``True`` if every point below a point in the set is also in
+            the set. These are the open sets of the topology
+        """
+        members = self._strict_positions(subset)
+        if members is None:
+            return False
+        return all(
+            lower in members
+            for upper in members for lower in self._below[upper]
+        )
+
+    def _position(self, element: T) -> int:
+        """
+
+        :param element: The element to look up
+        :return: The position of the element
+        :raises InvalidSubset: If the element is not in the topology
+        """
+        if element not in self._index:
+            raise InvalidSubset(
+                'The element %s is not in the topology' % (element,)
+            )
+        return self._index.position(element)
+
+    def _positions_in(self, subset: Container[T]) -> List[int]:
+        """
+
+        :param subset: The subset to look up
+        :return: The positions of the elements in the subset
+        """
+        if isinstance(subset, Collection):
+            return [
+                self._index.position(item) for item in subset
+                if item in self._index
+            ]
+        return [
+            position for position, element in enumerate(self._index)
+            if element in subset
+        ]
+
+    def _strict_positions(self, subset: object) -> Optional[FrozenSet[int]]:
+        """
+
+        :param subset: The object to look up
+        :return: The positions of the items in the object, or ``None`` if the
+            object is not iterable or has an item that is not an element
+        """
+        if not isinstance(subset, Iterable):
+            return None
+        positions = set()
+        for item in subset:
+            if item not in self._index:
+                return None
+            positions.add(self._index.position(item))
+        return frozenset(positions)
+
+    def _positions_outside(self, subset: Container[T]) -> List[int]:
+        """
+
+        :param subset: The subset to look up
+        :return: The positions of the elements that are not in the subset
+        """
+        inside = frozenset(self._positions_in(subset))
+        return [
+            position for position in range(len(self._index))
+            if position not in inside
+        ]
+
+    def _members(self, positions: Iterable[int]) -> FrozenSet[T]:
+        """
+
+        :param positions: The positions to convert
+        :return: The elements at the given positions
+        """
+        return frozenset(map(self._index.element, positions))
+
+    @staticmethod
+    def _reach(
+            start: Iterable[int], edges: Tuple[Tuple[int, ...], ...]
+    ) -> Set[int]:
+        """
+
+        :param start: The positions from which to start walking
+        :param edges: The edges of the graph to walk along
+        :return: The positions reachable from the start positions, including
+            the start positions
+        """
+        reached = set(start)
+        stack = list(reached)
+        while stack:
+            for neighbor in edges[stack.pop()]:
+                if neighbor not in reached:
+                    reached.add(neighbor)
+                    stack.append(neighbor)
+        return reached
+
+    def _index_minimal_neighborhoods(
+            self
+    ) -> Tuple[ElementIndex[T], List[int]]:
+        """
+
+        :return: The index of minimal neighborhoods, built by walking the
+            preorder instead of scanning the open sets
+        """
+        neighborhoods = []
+        for position in range(len(self._index)):
+            mask = 0
+            for lower in self._reach([position], self._below):
+                mask |= 1 << lower
+            neighborhoods.append(mask)
+        return self._index, neighborhoods
+
+    def _is_point(self, point_or_set: Union[T, Container[T]]) -> bool:
+        """
+
+        :param point_or_set: The object to check
+        :return: ``True`` if the object is an element of this topology
+        """
+        return point_or_set in self._index
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Two finite topologies on the same elements are equal iff every point
+        has the same minimal neighborhood in both.
+
+        :param other: The topology against which this is to be compared
+        :return: ``True`` if the topologies are equal
+        """
+        if not isinstance(other, FiniteTopologyInterface):
+            return False
+        if self._element_set != frozenset(other.elements):
+            return False
+        return all(
+            self.minimal_neighborhood(element) ==
+            frozenset(other.minimal_neighborhood(element))
+            for element in self._element_set
+        )
+
+    def __repr__(self) -> str:
+        """
+
+        :return: A user-friendly representation of the topology
+        """
+        return '{0}(elements={1}, below={2})'.format(
+            self.__class__.__name__, self._element_set, {
+                element: self._members(self._below[position])
+                for position, element in enumerate(self._index)
+            }
+        )
+
+    class _OpenSets(LazyOpenSets[T]):
+        """
+        The open sets of a preorder topology. Membership is decided from the
+        preorder, and the open sets are only generated when iterated over.
+        """
+        def __contains__(self, item: object) -> bool:
+            """
+
+            :param item: The set to check
+            :return: ``True`` if the set is down-closed
+            """
+            topology = cast(PreorderTopology[T], self._topology)
+            return topology.is_down_closed(cast(Collection[T], item))
+
+    class _OpenNeighborhoods(Collection[Collection[T]]):
+        """
+        The open sets of a preorder topology that contain a given open set
+        """
+        def __init__(
+                self,
+                topology: 'PreorderTopology[T]',
+                required: FrozenSet[T]
+        ) -> None:
+            """
+
+            :param topology: The topology in which the neighborhoods are taken
+            :param required: The smallest open set that every neighborhood
+                contains
+            """
+            self._topology = topology
+            self._required = required
+            self._length = None  # type: Optional[int]
+
+        def __iter__(self) -> Iterator[Collection[T]]:
+            return (
+                open_set for open_set in self._topology.open_sets
+                if self._required.issubset(open_set)
+            )
+
+        def __len__(self) -> int:
+            if self._length is None:
+                self._length = sum(1 for _ in self)
+            return self._length
+
+        def __contains__(self, item: object) -> bool:
+            collection = cast(Collection[T], item)
+            return self._topology.is_down_closed(collection) and all(
+                element in collection for element in self._required
+            )
@@ -1,70 +1,124 @@
 """
 Describes how to generate a random topology from a set of elements
 """
-from fom.topologies.abc.finite_topology import FiniteTopology
-from typing import Set, TypeVar, Generic
-from random import randint, sample
+from fom.topologies.preorder_topology import PreorderTopology
+from fom.bitsets import ElementIndex
+from typing import Collection, Generic, Iterator, List, Optional
+from typing import TypeVar
+from random import Random
 
 T = TypeVar('T')
 
 
-class RandomTopology(FiniteTopology, Generic[T]):
+class RandomTopology(PreorderTopology[T], Generic[T]):
     """
-    Describes a topology where the open sets are made randomly using the
-    following algorithm
+    Describes a topology made from a random specialization preorder, using
+    the following algorithm
 
-    Add the empty set and set of elements to the set of open sets
-    Make two sets of random length from the provided elements
-    Add the random sets, their union, and their intersection
-    Repeat until the desired number of open sets are made
+    Shuffle the elements
+    For each element, while a random number is less than the density, put a
+    random element that comes before it in the shuffled order below it
+
+    Every preorder gives a valid topology, so the open sets are closed under
+    unions and intersections by construction. The expected number of
+    relations per element is about ``density / (1 - density)``. A density of
+    ``0`` gives the discrete topology, where every subset is open, and higher
+    densities give fewer open sets. The topology is made in time linear in
+    the number of elements and relations.
     """
     def __init__(
             self,
-            elements: Set[T],
-            number_of_randomizing_rounds: int=5
-    ):
+            elements: Collection[T],
+            density: float=0.5,
+            seed: Optional[int]=None
+    ) -> None:
         """
 
-        :param elements: The set of elements from which the number of sets is
-        to be obtained
-        :param number_of_randomizing_rounds: The number of rounds with which
-        the topology is to be randomized
+        :param elements: The set of elements from which the topology is to
+            be made
+        :param density: The probability of adding each further relation
+            below an element, between ``0`` and ``1``
+        :param seed: The seed for the random number generator. The same
+            elements, density and seed always give the same topology
+        :raises ValueError: If the density is not between ``0`` and ``1``
         """
-        open_sets = set()
-        open_sets.add(frozenset())
-        open_sets.add(frozenset(elements))
+        if not 0 <= density <= 1:
+            raise ValueError(
+                'The density %s is not between 0 and 1' % (density,)
+            )
+        self._density = density
+        self._seed = seed
 
-        for _ in range(0, number_of_randomizing_rounds):
-            self._add_to_open_sets(elements, open_sets)
+        random = Random(seed)
+        order = self._canonical_order(elements)
+        random.shuffle(order)
+        self._index = ElementIndex(order)
 
-        self._elements = elements
-        self._open_sets = open_sets
+        below_lists = []  # type: List[List[int]]
+        for position in range(len(order)):
+            lower = []  # type: List[int]
+            while len(lower) < position and random.random() < density:
+                lower.append(int(random.random() * position))
+            below_lists.append(lower)
 
-    @staticmethod
-    def _add_to_open_sets(elements: Set[T], open_sets: Set[Set[T]]) -> None:
-        first_random_set = frozenset(
-            sample(elements, randint(0, len(elements)))
-        )
-        second_random_set = frozenset(
-            sample(elements, randint(0, len(elements)))
-        )
-        open_sets.add(first_random_set)
-        open_sets.add(second_random_set)
-        open_sets.add(first_random_set.union(second_random_set))
-        open_sets.add(first_random_set.intersection(second_random_set))
+        self._set_relations(below_lists)
 
     @property
-    def elements(self) -> Set[T]:
+    def density(self) -> float:
         """
 
-        :return: The elements of the topology
+        :return: The density with which the topology was made
         """
-        return self._elements
+        return self._density
 
     @property
-    def open_sets(self) -> Set[Set[T]]:
+    def seed(self) -> Optional[int]:
+        """
+
+        :return: The seed with which the topology was made
         """
+        return self._seed
 
-        :return: The open sets
+    @staticmethod
+    def _canonical_order(elements: Collection[T]) -> List[T]:
         """
-        return self._open_sets
+
+        :param elements: The elements to be ordered
+        :return: The elements in sorted order if they can be sorted, and in
+            the order of their representations otherwise, so that a seed
+            gives the same topology between processes
+        """
+        try:
+            return sorted(elements)
+        except TypeError:
+            return sorted(elements, key=repr)
+
+    def __repr__(self) -> str:
+        """
+
+        :return: A user-friendly representation of the topology
+        """
+        return '{0}(elements={1}, density={2}, seed={3})'.format(
+            self.__class__.__name__, self.elements, self._density, self._seed
+        )
+
+
+def random_topologies(
+        elements: Collection[T],
+        density: float=0.5,
+        seed: Optional[int]=None
+) -> Iterator[RandomTopology[T]]:
+    """
+    Stream random topologies on the same elements, for instance to sweep a
+    property over many topologies. Each topology is made with its own seed,
+    drawn from a generator seeded with the given seed, so that any one
+    topology in the stream can be made again from its :attr:`seed`.
+
+    :param elements: The elements of the topologies
+    :param density: The density with which each topology is made
+    :param seed: The seed of the stream
+    :return: An endless iterator of random topologies
+    """
+    random = Random(seed)
+    while True:
+        yield RandomTopology(elements, density, random.getrandbits(64))
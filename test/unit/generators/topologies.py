@@ -1,11 +1,12 @@
-from hypothesis.strategies import composite, integers, frozensets
+from hypothesis.strategies import composite, integers, frozensets, floats
 from fom.interfaces import FiniteTopology as AbstractTopology
 from fom.topologies import RandomTopology
 
 
 @composite
 def topologies(
-        draw, elements=frozensets(integers()), number_of_rounds=5
+        draw, elements=frozensets(integers(), max_size=8),
+        densities=floats(0, 1)
 ) -> AbstractTopology[int]:
     """
 
@@ -13,8 +14,10 @@ def topologies(
         to sample from a generator
     :param elements: A generator of sets of elements from which the topology
         is to be built
-    :param number_of_rounds: The number of randomization rounds for which the
-        topology is to be built
+    :param densities: A generator of densities with which the topology is to
+        be built
     :return: A random topology
     """
-    return RandomTopology(draw(elements), number_of_rounds)
+    return RandomTopology(
+        draw(elements), draw(densities), draw(integers(0, 2 ** 64 - 1))
+    )
@@ -8,8 +8,9 @@ from test.unit.generators import topologies, topological_subsets
 from test.unit.generators import TopologicalSubset
 from fom.interfaces import FiniteTopology, Topology
 from fom.topologies import CustomTopology
+from fom.topologies.abc import FiniteTopology as AbstractFiniteTopology
 from functools import reduce
-from typing import List, TypeVar
+from typing import FrozenSet, List, TypeVar
 import operator
 from fom.topologies import EmptyTopology
 from itertools import product
@@ -139,3 +140,60 @@ class TestProduct(TestFiniteTopology):
             set(product(first.elements, second.elements)),
             product_topology.elements
         )
+
+
+class ConcreteFiniteTopology(AbstractFiniteTopology[str]):
+    """
+    A finite topology on four points using only the operators of the
+    abstract base class
+    """
+    @property
+    def elements(self) -> FrozenSet[str]:
+        return frozenset({'a', 'b', 'c', 'd'})
+
+    @property
+    def open_sets(self) -> FrozenSet[FrozenSet[str]]:
+        return frozenset({
+            frozenset(), frozenset({'a'}), frozenset({'b'}),
+            frozenset({'a', 'b'}), frozenset({'a', 'b', 'c'}), self.elements
+        })
+
+
+class TestMinimalNeighborhoods(TestFiniteTopology):
+    """
+    Contains unit tests for the operators derived from minimal neighborhoods
+    """
+    def setUp(self) -> None:
+        self.topology = ConcreteFiniteTopology()
+
+    def test_minimal_neighborhood(self) -> None:
+        self.assertEqual({'a'}, self.topology.minimal_neighborhood('a'))
+        self.assertEqual(
+            {'a', 'b', 'c'}, self.topology.minimal_neighborhood('c')
+        )
+
+    def test_open_neighborhoods_of_point(self) -> None:
+        neighborhoods = self.topology.get_open_neighborhoods('c')
+        self.assertEqual(2, len(neighborhoods))
+        self.assertIn(frozenset({'a', 'b', 'c'}), neighborhoods)
+        self.assertNotIn(frozenset({'a', 'b'}), neighborhoods)
+        self.assertNotIn(frozenset({'c', 'd'}), neighborhoods)
+
+    def test_open_neighborhoods_of_set(self) -> None:
+        neighborhoods = self.topology.get_open_neighborhoods(
+            frozenset({'a', 'b'})
+        )
+        self.assertEqual(3, len(neighborhoods))
+        self.assertEqual(
+            {frozenset({'a', 'b'}), frozenset({'a', 'b', 'c'}),
+             self.topology.elements},
+            set(neighborhoods)
+        )
+
+    def test_closure(self) -> None:
+        self.assertEqual({'b', 'c', 'd'}, self.topology.closure({'b'}))
+        self.assertEqual({'c', 'd'}, self.topology.closure({'c'}))
+
+    def test_interior(self) -> None:
+        self.assertEqual({'a', 'b'}, self.topology.interior({'a', 'b', 'd'}))
+        self.assertEqual(set(), self.topology.interior({'c', 'd'}))
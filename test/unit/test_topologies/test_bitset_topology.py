@@ -0,0 +1,111 @@
+"""
+Contains unit tests for the bitset topology
+"""
+import unittest
+from functools import reduce
+from hypothesis import given
+from hypothesis.strategies import frozensets, sampled_from
+from fom.topologies import BitsetTopology, CustomTopology
+from fom.exceptions import InvalidOpenSets
+
+
+class TestBitsetTopology(unittest.TestCase):
+    """
+    Base class for testing the bitset topology. The topology is the chain
+    topology on three elements
+    """
+    elements = frozenset({'a', 'b', 'c'})
+    open_sets = frozenset({
+        frozenset(), frozenset({'a'}), frozenset({'a', 'b'}), elements
+    })
+
+    def setUp(self) -> None:
+        self.topology = BitsetTopology(self.elements, self.open_sets)
+
+
+class TestConstructor(TestBitsetTopology):
+    """
+    Tests the constructor
+    """
+    def test_valid_topology(self) -> None:
+        self.assertEqual(self.elements, self.topology.elements)
+        self.assertEqual(self.open_sets, self.topology.open_sets)
+        self.assertEqual(len(self.open_sets), len(self.topology.open_sets))
+
+    def test_no_empty_set(self) -> None:
+        with self.assertRaises(InvalidOpenSets):
+            BitsetTopology(self.elements, {self.elements})
+
+    def test_no_element_set(self) -> None:
+        with self.assertRaises(InvalidOpenSets):
+            BitsetTopology(self.elements, {frozenset()})
+
+    def test_from_topology(self) -> None:
+        custom = CustomTopology(self.elements, self.open_sets)
+        self.assertEqual(BitsetTopology.from_topology(custom), self.topology)
+
+
+class TestMembership(TestBitsetTopology):
+    """
+    Tests membership in the open and closed sets
+    """
+    def test_open_sets(self) -> None:
+        self.assertIn(frozenset({'a', 'b'}), self.topology.open_sets)
+        self.assertIn({'a'}, self.topology.open_sets)
+        self.assertNotIn(frozenset({'b'}), self.topology.open_sets)
+        self.assertNotIn(frozenset({'d'}), self.topology.open_sets)
+
+    def test_closed_sets(self) -> None:
+        for closed_set in self.topology.closed_sets:
+            self.assertIn(
+                self.topology.complement(closed_set), self.topology.open_sets
+            )
+        self.assertIn(frozenset({'c'}), self.topology.closed_sets)
+        self.assertNotIn(frozenset({'a'}), self.topology.closed_sets)
+
+    def test_open_neighborhoods(self) -> None:
+        self.assertEqual(
+            {frozenset({'a', 'b'}), self.elements},
+            self.topology.get_open_neighborhoods('b')
+        )
+        self.assertEqual(
+            {self.elements},
+            self.topology.get_open_neighborhoods(frozenset({'a', 'c'}))
+        )
+
+
+class TestOperators(TestBitsetTopology):
+    """
+    Tests the closure, interior, boundary and complement
+    """
+    def test_operators(self) -> None:
+        subset = frozenset({'b'})
+        self.assertEqual({'b', 'c'}, self.topology.closure(subset))
+        self.assertEqual(frozenset(), self.topology.interior(subset))
+        self.assertEqual({'b', 'c'}, self.topology.boundary(subset))
+        self.assertEqual({'a', 'c'}, self.topology.complement(subset))
+
+    @given(frozensets(sampled_from(sorted(TestBitsetTopology.elements))))
+    def test_closure_is_smallest_closed_superset(self, subset) -> None:
+        """
+        Check the closure against its definition as the intersection of all
+        closed sets containing the subset
+        """
+        expected = reduce(
+            frozenset.intersection,
+            (frozenset(self.elements - open_set)
+             for open_set in self.open_sets
+             if subset.isdisjoint(open_set)),
+            self.elements
+        )
+        self.assertEqual(expected, self.topology.closure(subset))
+
+    @given(frozensets(sampled_from(sorted(TestBitsetTopology.elements))))
+    def test_interior_is_largest_open_subset(self, subset) -> None:
+        expected = reduce(
+            frozenset.union,
+            (open_set for open_set in self.open_sets
+             if open_set.issubset(subset)),
+            frozenset()
+        )
+        self.assertEqual(expected, self.topology.interior(subset))
@@ -0,0 +1,58 @@
+"""
+Contains unit tests for the boolean matrix engine
+"""
+import unittest
+from itertools import chain, combinations
+from fom.topologies import BitsetTopology, BooleanMatrixEngine
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class TestBooleanMatrixEngine(unittest.TestCase):
+    """
+    Compares the batched operators against the bitset topology for every
+    subset of a small topology
+    """
+    def setUp(self) -> None:
+        elements = frozenset({1, 2, 3, 4})
+        open_sets = frozenset({
+            frozenset(), frozenset({1}), frozenset({2}), frozenset({1, 2}),
+            frozenset({1, 2, 3}), elements
+        })
+        self.topology = BitsetTopology(elements, open_sets)
+        self.engine = BooleanMatrixEngine(self.topology, chunk_size=5)
+        self.subsets = [
+            frozenset(subset) for subset in chain.from_iterable(
+                combinations(sorted(elements), size) for size in range(5)
+            )
+        ]
+        self.queries = self.engine.to_matrix(self.subsets)
+
+    def test_round_trip(self) -> None:
+        self.assertEqual(self.subsets, self.engine.to_sets(self.queries))
+
+    def test_closures(self) -> None:
+        self.assertEqual(
+            [self.topology.closure(subset) for subset in self.subsets],
+            self.engine.to_sets(self.engine.closures(self.queries))
+        )
+
+    def test_interiors(self) -> None:
+        self.assertEqual(
+            [self.topology.interior(subset) for subset in self.subsets],
+            self.engine.to_sets(self.engine.interiors(self.queries))
+        )
+
+    def test_boundaries(self) -> None:
+        self.assertEqual(
+            [self.topology.boundary(subset) for subset in self.subsets],
+            self.engine.to_sets(self.engine.boundaries(self.queries))
+        )
+
+    def test_wrong_shape(self) -> None:
+        with self.assertRaises(ValueError):
+            self.engine.closures(np.zeros((2, 3), dtype=bool))
@@ -5,6 +5,7 @@ import unittest
 from typing import Set, FrozenSet, Union, TypeVar
 from fom.topologies.custom_topology import CustomTopology
 from fom.interfaces import Topology
+from fom.exceptions import InvalidOpenSets
 from hypothesis import given
 from test.unit.generators import topologies
 
@@ -68,6 +69,44 @@ class TestCustomTopologyConstructor(TestCustomTopology):
             CustomTopology(self.elements, self.open_sets_without_elements)
 
 
+class TestCustomTopologyValidation(unittest.TestCase):
+    """
+    Tests that the constructor checks closure under unions and intersections
+    when asked to
+    """
+    def setUp(self) -> None:
+        self.elements = frozenset({1, 2, 3})
+
+    def test_valid_topology(self) -> None:
+        open_sets = {
+            frozenset(), frozenset({1}), frozenset({2}), frozenset({1, 2}),
+            self.elements
+        }
+        topology = CustomTopology(self.elements, open_sets, validate=True)
+        self.assertEqual({1, 2, 3}, topology.minimal_neighborhood(3))
+        self.assertEqual({1}, topology.minimal_neighborhood(1))
+
+    def test_intersection_not_open(self) -> None:
+        open_sets = {
+            frozenset(), frozenset({1, 2}), frozenset({2, 3}), self.elements
+        }
+        CustomTopology(self.elements, open_sets)
+        with self.assertRaises(InvalidOpenSets):
+            CustomTopology(self.elements, open_sets, validate=True)
+
+    def test_union_not_open(self) -> None:
+        open_sets = {
+            frozenset(), frozenset({1}), frozenset({2}), self.elements
+        }
+        with self.assertRaises(InvalidOpenSets):
+            CustomTopology(self.elements, open_sets, validate=True)
+
+    def test_open_set_not_subset(self) -> None:
+        open_sets = {frozenset(), frozenset({4}), self.elements}
+        with self.assertRaises(InvalidOpenSets):
+            CustomTopology(self.elements, open_sets, validate=True)
+
+
 class TestCustomTopologyGenerator(TestCustomTopology):
     """
     Tests that the topology generator makes random topologies
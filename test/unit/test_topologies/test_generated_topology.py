@@ -0,0 +1,53 @@
+"""
+Contains unit tests for generating a topology from a subbasis
+"""
+import unittest
+from hypothesis import given
+from hypothesis.strategies import frozensets, lists, sampled_from
+from fom.topologies import generate_topology, CustomTopology
+from fom.exceptions import InvalidSubset
+
+
+class TestGenerateTopology(unittest.TestCase):
+    """
+    Tests that the generated topology is the smallest topology containing
+    the subbasis
+    """
+    elements = frozenset(range(5))
+
+    def test_open_sets(self) -> None:
+        topology = generate_topology(self.elements, [{1, 2}, {2, 3}])
+        self.assertEqual({
+            frozenset(), frozenset({2}), frozenset({1, 2}),
+            frozenset({2, 3}), frozenset({1, 2, 3}), self.elements
+        }, set(topology.open_sets))
+
+    def test_empty_subbasis(self) -> None:
+        topology = generate_topology(self.elements, [])
+        self.assertEqual(
+            {frozenset(), self.elements}, set(topology.open_sets)
+        )
+
+    def test_invalid_subbasis(self) -> None:
+        with self.assertRaises(InvalidSubset):
+            generate_topology(self.elements, [{1, 6}])
+
+    @given(lists(frozensets(sampled_from(sorted(elements)))))
+    def test_closed_under_unions_and_intersections(self, subbasis) -> None:
+        topology = generate_topology(self.elements, subbasis)
+        open_sets = frozenset(topology.open_sets)
+        CustomTopology(self.elements, open_sets, validate=True)
+        for subset in subbasis:
+            self.assertIn(subset, topology.open_sets)
+
+    def test_large_subbasis(self) -> None:
+        """
+        The open sets of the topology generated by the initial segments of
+        a long sequence are the initial segments
+        """
+        elements = range(300)
+        topology = generate_topology(
+            elements, [range(end) for end in range(300)]
+        )
+        self.assertEqual({0, 1, 2}, topology.minimal_neighborhood(2))
+        self.assertEqual(301, len(topology.open_sets))
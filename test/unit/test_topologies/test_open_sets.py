@@ -0,0 +1,114 @@
+"""
+Contains unit tests for the lazy enumeration of open sets
+"""
+import pickle
+import unittest
+from fom.topologies import BitsetTopology, PreorderTopology
+from fom.topologies.open_sets import LazyOpenSets, OpenSetCursor
+from fom.topologies.open_sets import count_open_sets
+
+
+class TestLazyOpenSets(unittest.TestCase):
+    """
+    Base class for testing lazy open sets. The topology is given by a
+    preorder on five points, with ``1`` and ``2`` below ``3``, ``3`` below
+    ``4``, and ``5`` unrelated to the other points
+    """
+    def setUp(self) -> None:
+        self.topology = PreorderTopology(
+            range(1, 6), {3: {1, 2}, 4: {3}}
+        )
+        self.open_sets = list(self.topology.open_sets)
+
+
+class TestEnumeration(TestLazyOpenSets):
+    """
+    Tests that every open set is generated exactly once, in canonical order
+    """
+    def test_open_sets(self) -> None:
+        self.assertEqual(12, len(self.open_sets))
+        self.assertEqual(len(self.open_sets), len(set(self.open_sets)))
+        self.assertEqual(
+            set(self.topology.to_topology(BitsetTopology).open_sets),
+            set(self.open_sets)
+        )
+
+    def test_canonical_order(self) -> None:
+        """
+        The order of the open sets does not depend on the order in which the
+        elements were given
+        """
+        reordered = PreorderTopology(
+            [5, 4, 3, 2, 1], {4: {3}, 3: {2, 1}}
+        )
+        self.assertEqual(self.open_sets, list(reordered.open_sets))
+        self.assertEqual(frozenset(), self.open_sets[0])
+        self.assertEqual(self.topology.elements, self.open_sets[-1])
+
+    def test_any_topology(self) -> None:
+        bitset_topology = self.topology.to_topology(BitsetTopology)
+        self.assertEqual(
+            self.open_sets, list(LazyOpenSets(bitset_topology))
+        )
+
+    def test_membership(self) -> None:
+        open_sets = LazyOpenSets(self.topology)
+        self.assertIn(frozenset({1, 2, 3}), open_sets)
+        self.assertNotIn(frozenset({3}), open_sets)
+        self.assertNotIn(frozenset({6}), open_sets)
+
+
+class TestResume(TestLazyOpenSets):
+    """
+    Tests resuming the enumeration from a rank or a cursor
+    """
+    def test_iter_from_rank(self) -> None:
+        for rank in range(len(self.open_sets) + 1):
+            self.assertEqual(
+                self.open_sets[rank:],
+                list(self.topology.open_sets.iter_from(rank))
+            )
+
+    def test_iter_from_cursor(self) -> None:
+        iterator = self.topology.open_sets.iter_from(0)
+        self.assertIsNone(iterator.cursor)
+        for rank, open_set in enumerate(iterator):
+            cursor = pickle.loads(pickle.dumps(iterator.cursor))
+            self.assertEqual(OpenSetCursor(rank, open_set), cursor)
+            self.assertEqual(
+                self.open_sets[rank + 1:],
+                list(self.topology.open_sets.iter_from(cursor))
+            )
+
+
+class TestCount(TestLazyOpenSets):
+    """
+    Tests counting the open sets without generating them
+    """
+    def test_count(self) -> None:
+        self.assertEqual(len(self.open_sets), count_open_sets(self.topology))
+        self.assertEqual(
+            len(self.open_sets),
+            count_open_sets(self.topology.to_topology(BitsetTopology))
+        )
+
+    def test_count_chain(self) -> None:
+        """
+        The open sets of a chain of ``n`` points are the ``n + 1`` initial
+        segments of the chain
+        """
+        chain = PreorderTopology(
+            range(500), {point: {point - 1} for point in range(1, 500)}
+        )
+        self.assertEqual(501, count_open_sets(chain))
+
+    def test_count_antichain(self) -> None:
+        """
+        Every subset of an antichain is open
+        """
+        antichain = PreorderTopology(range(200), {})
+        self.assertEqual(2 ** 200, count_open_sets(antichain))
+        self.assertEqual(
+            frozenset(range(200)),
+            next(antichain.open_sets.iter_from(2 ** 200 - 1))
+        )
@@ -0,0 +1,100 @@
+"""
+Contains unit tests for the preorder topology
+"""
+import unittest
+from hypothesis import given
+from hypothesis.strategies import frozensets, sampled_from
+from fom.topologies import PreorderTopology, CustomTopology, BitsetTopology
+from fom.exceptions import InvalidSubset
+
+
+class TestPreorderTopology(unittest.TestCase):
+    """
+    Base class for testing the preorder topology. The preorder has ``a`` and
+    ``b`` below ``c``, and ``c`` below ``d``
+    """
+    elements = frozenset({'a', 'b', 'c', 'd'})
+
+    def setUp(self) -> None:
+        self.topology = PreorderTopology(
+            self.elements, {'c': {'a', 'b'}, 'd': {'c'}}
+        )
+        self.bitset_topology = BitsetTopology.from_topology(self.topology)
+
+
+class TestConstructor(TestPreorderTopology):
+    """
+    Tests the constructor and converters
+    """
+    def test_open_sets(self) -> None:
+        self.assertEqual({
+            frozenset(), frozenset({'a'}), frozenset({'b'}),
+            frozenset({'a', 'b'}), frozenset({'a', 'b', 'c'}), self.elements
+        }, set(self.topology.open_sets))
+        self.assertEqual(6, len(self.topology.open_sets))
+
+    def test_invalid_relation(self) -> None:
+        with self.assertRaises(InvalidSubset):
+            PreorderTopology(self.elements, {'e': {'a'}})
+
+    def test_round_trip(self) -> None:
+        custom = self.topology.to_topology(CustomTopology)
+        self.assertIsInstance(custom, CustomTopology)
+        self.assertEqual(self.topology, PreorderTopology.from_topology(custom))
+
+    def test_cycle(self) -> None:
+        """
+        Points on a cycle of the preorder are in the same open sets
+        """
+        topology = PreorderTopology({1, 2, 3}, {1: {2}, 2: {1}})
+        self.assertEqual(
+            {frozenset(), frozenset({1, 2}), frozenset({3}),
+             frozenset({1, 2, 3})},
+            set(topology.open_sets)
+        )
+
+
+class TestMembership(TestPreorderTopology):
+    """
+    Tests membership in the open sets and open neighborhoods
+    """
+    def test_open_sets(self) -> None:
+        self.assertIn(frozenset({'a', 'b', 'c'}), self.topology.open_sets)
+        self.assertNotIn(frozenset({'a', 'c'}), self.topology.open_sets)
+        self.assertNotIn(frozenset({'e'}), self.topology.open_sets)
+
+    def test_open_neighborhoods(self) -> None:
+        neighborhoods = self.topology.get_open_neighborhoods('c')
+        self.assertEqual(2, len(neighborhoods))
+        self.assertIn(frozenset({'a', 'b', 'c'}), neighborhoods)
+        self.assertNotIn(frozenset({'a', 'b'}), neighborhoods)
+
+    def test_minimal_neighborhood(self) -> None:
+        self.assertEqual(self.elements, self.topology.minimal_neighborhood('d'))
+        self.assertEqual({'a'}, self.topology.minimal_neighborhood('a'))
+
+
+class TestOperators(TestPreorderTopology):
+    """
+    Compares the operators against the bitset topology with the same open
+    sets
+    """
+    @given(frozensets(sampled_from(sorted(TestPreorderTopology.elements))))
+    def test_closure(self, subset) -> None:
+        self.assertEqual(
+            self.bitset_topology.closure(subset), self.topology.closure(subset)
+        )
+
+    @given(frozensets(sampled_from(sorted(TestPreorderTopology.elements))))
+    def test_interior(self, subset) -> None:
+        self.assertEqual(
+            self.bitset_topology.interior(subset),
+            self.topology.interior(subset)
+        )
+
+    @given(frozensets(sampled_from(sorted(TestPreorderTopology.elements))))
+    def test_boundary(self, subset) -> None:
+        self.assertEqual(
+            self.bitset_topology.boundary(subset),
+            self.topology.boundary(subset)
+        )
@@ -0,0 +1,58 @@
+"""
+Contains unit tests for the random topology
+"""
+import unittest
+from itertools import islice
+from hypothesis import given
+from hypothesis.strategies import floats, integers
+from fom.topologies import RandomTopology, CustomTopology, random_topologies
+
+
+class TestRandomTopology(unittest.TestCase):
+    """
+    Tests that random topologies are valid and reproducible
+    """
+    elements = frozenset(range(8))
+
+    @given(floats(0, 1), integers())
+    def test_valid_topology(self, density: float, seed: int) -> None:
+        topology = RandomTopology(self.elements, density, seed)
+        self.assertEqual(self.elements, topology.elements)
+        CustomTopology(
+            self.elements, frozenset(topology.open_sets), validate=True
+        )
+
+    def test_seed(self) -> None:
+        self.assertEqual(
+            RandomTopology(self.elements, 0.5, 1),
+            RandomTopology(self.elements, 0.5, 1)
+        )
+        self.assertNotEqual(
+            set(RandomTopology(self.elements, 0.5, 1).open_sets),
+            set(RandomTopology(self.elements, 0.5, 2).open_sets)
+        )
+
+    def test_density(self) -> None:
+        discrete = RandomTopology(self.elements, 0)
+        self.assertEqual(2 ** len(self.elements), len(discrete.open_sets))
+        dense = RandomTopology(self.elements, 1)
+        self.assertLess(len(dense.open_sets), len(discrete.open_sets))
+
+    def test_invalid_density(self) -> None:
+        with self.assertRaises(ValueError):
+            RandomTopology(self.elements, 1.5)
+
+    def test_stream(self) -> None:
+        topologies = list(islice(random_topologies(self.elements, 0.5, 1), 5))
+        self.assertEqual(5, len(topologies))
+        self.assertEqual(topologies, list(islice(
+            random_topologies(self.elements, 0.5, 1), 5
+        )))
+        for topology in topologies:
+            self.assertEqual(
+                topology, RandomTopology(self.elements, 0.5, topology.seed)
+            )
+
+    def test_large_topology(self) -> None:
+        topology = RandomTopology(range(100000), 0.5, 1)
+        self.assertEqual(100000, len(topology.elements))